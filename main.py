@@ -16,18 +16,18 @@ It then loads the settings, and then loads the start screen.
 
 
 """ # pylint: enable=line-too-long
+import atexit
 import shutil
 import sys
 import time
 import os
-import i18n
 import asyncio
 import platform
 import scripts.platformwrapper as web
 
 
 from scripts.housekeeping.log_cleanup import prune_logs
-from scripts.housekeeping.stream_duplexer import UnbufferedStreamDuplexer
+from scripts.housekeeping.stream_duplexer import BufferedStreamDuplexer
 from scripts.housekeeping.datadir import get_log_dir, setup_data_dir, get_save_dir, get_data_dir
 from scripts.housekeeping.version import get_version_info, VERSION_NAME
 
@@ -66,23 +66,35 @@ async def main():
         }
         """)
 
-        while web.window.get("fs_loaded") is False: # pylint: disable=no-member
-            print("Waiting for fs to load...")
-            await asyncio.sleep(0.1)
+        print("Waiting for fs to load...")
+        await web.wait_for("fs_loaded")
+
+        # Tracked so the frame loop can idle while the tab is hidden.
+        web.eval("""
+        window.__clangen_visible = !document.hidden
+        document.addEventListener('visibilitychange', () => {
+            window.__clangen_visible = !document.hidden
+        })
+        """)
 
         
         if platform.window.localStorage.getItem("hasMigrated") is None: # pylint: disable=no-member
             print("Migrating from localStorage to IndexedDB")
-            
-            for i in range(platform.window.localStorage.length): # pylint: disable=no-member
-                key = platform.window.localStorage.key(i) # pylint: disable=no-member
-                value = platform.window.localStorage.getItem(key) # pylint: disable=no-member
-                
-                if key in ['hasMigrated', '/', 'currentclan', 'clanlist.txt', '__test__']:
-                    continue
-                os.makedirs(os.path.dirname(f"{get_save_dir()}/{key}"), exist_ok=True)
-                with open(f"{get_save_dir()}/{key}", "w") as f:
-                    f.write(value)
+
+            # Copy the whole store inside a single JS call: every Python-side
+            # write is an Asyncify suspend/resume on top of an IDBFS op, so
+            # keep the per-key loop on the JS side and cross the bridge once.
+            web.eval("""
+            (() => {
+                const skip = ['hasMigrated', '/', 'currentclan', 'clanlist.txt', '__test__'];
+                for (const [key, value] of Object.entries(localStorage)) {
+                    if (skip.includes(key)) continue;
+                    const path = '""" + get_save_dir() + """/' + key;
+                    try { FS.mkdirTree(path.substring(0, path.lastIndexOf('/'))); } catch (err) {}
+                    FS.writeFile(path, value);
+                }
+            })()
+            """)
             platform.window.localStorage.setItem("hasMigrated", "true") # pylint: disable=no-member
 
             web.pushdb()
@@ -94,10 +106,23 @@ async def main():
     timestr = time.strftime("%Y%m%d_%H%M%S")
 
 
-    stdout_file = open(get_log_dir() + f'/stdout_{timestr}.log', 'a')
-    stderr_file = open(get_log_dir() + f'/stderr_{timestr}.log', 'a')
-    sys.stdout = UnbufferedStreamDuplexer(sys.stdout, stdout_file)
-    sys.stderr = UnbufferedStreamDuplexer(sys.stderr, stderr_file)
+    # Buffer the file side of the duplexers; flushing every single write
+    # costs a syscall per print, which adds up inside the frame loop.
+    stdout_file = open(get_log_dir() + f'/stdout_{timestr}.log', 'a', buffering=65536)
+    stderr_file = open(get_log_dir() + f'/stderr_{timestr}.log', 'a', buffering=65536)
+    sys.stdout = BufferedStreamDuplexer(sys.stdout, stdout_file)
+    sys.stderr = BufferedStreamDuplexer(sys.stderr, stderr_file)
+    atexit.register(stdout_file.flush)
+    atexit.register(stderr_file.flush)
+
+    async def flush_logs():
+        """Flushes the buffered log files so a hard kill loses at most ~250 ms of output"""
+        while True:
+            await asyncio.sleep(0.25)
+            stdout_file.flush()
+            stderr_file.flush()
+
+    asyncio.create_task(flush_logs())
 
     # Setup logging
     import logging
@@ -107,21 +132,25 @@ async def main():
         )
 
 
-    # Logging for file
-    timestr = time.strftime("%Y%m%d_%H%M%S")
-    log_file_name = get_log_dir() + f"/clangen_{timestr}.log"
-    file_handler = logging.FileHandler(log_file_name)
-    file_handler.setFormatter(formatter)
-    # Only log errors to file
-    file_handler.setLevel(logging.ERROR)
-    # Logging for console
+    # Logging for console. sys.stderr is duplexed into stderr_{timestr}.log
+    # above, so this one handler covers both the console and the file -
+    # no need for a separate clangen_{timestr}.log handle (file handles
+    # mean IDBFS inodes on web).
     stream_handler = logging.StreamHandler()
     stream_handler.setFormatter(formatter)
-    logging.root.addHandler(file_handler)
     logging.root.addHandler(stream_handler)
 
 
-    prune_logs(logs_to_keep=10, retain_empty_logs=False)
+    async def prune_logs_task():
+        """Prunes old logs after startup instead of on the critical path"""
+        if web.is_web:
+            # No worker threads under Emscripten; still deferred to the
+            # first idle await.
+            prune_logs(logs_to_keep=10, retain_empty_logs=False)
+        else:
+            await asyncio.to_thread(prune_logs, logs_to_keep=10, retain_empty_logs=False)
+
+    asyncio.create_task(prune_logs_task())
 
 
     def log_crash(logtype, value, tb):
@@ -129,7 +158,10 @@ async def main():
         Log uncaught exceptions to file
         """
         logging.critical("Uncaught exception", exc_info=(logtype, value, tb))
-        sys.__excepthook__(type, value, tb)
+        # The log files are buffered now; make sure the crash reaches disk.
+        sys.stdout.flush()
+        sys.stderr.flush()
+        sys.__excepthook__(logtype, value, tb)
 
     sys.excepthook = log_crash
 
@@ -148,9 +180,15 @@ async def main():
         print('')
 
 
-    if get_version_info().is_source_build:
+    # get_version_info() is memoized, but there is no reason to keep
+    # re-resolving it either - bind the bits main() needs once.
+    version_info = get_version_info()
+    short_commit = version_info.version_number[0:8]
+    is_dev_build = version_info.is_source_build or version_info.is_dev()
+
+    if version_info.is_source_build:
         print("Running on source code")
-        if get_version_info().version_number == VERSION_NAME:
+        if version_info.version_number == VERSION_NAME:
             print("Failed to get git commit hash, using hardcoded version number instead.")
             print("Hey testers! We recommend you use git to clone the repository, as it makes things easier for everyone.")  # pylint: disable=line-too-long
             print("There are instructions at https://discord.com/channels/1003759225522110524/1054942461178421289/1078170877117616169")  # pylint: disable=line-too-long
@@ -158,14 +196,16 @@ async def main():
         print("Running on PyInstaller build")
 
     print("Version Name: ", VERSION_NAME)
-    print("Running on commit " + get_version_info().version_number)
+    print("Running on commit " + version_info.version_number)
 
     # Load game
+    # These imports are deliberately kept out of module scope: they pull in
+    # pygame, pygame_gui and every game subsystem, so they only run once the
+    # pre-flight (update flag, IDBFS mount/migration) is done.
     from scripts.game_structure.load_cat import load_cats, version_convert
     from scripts.game_structure.windows import SaveCheck
     from scripts.game_structure.game_essentials import game, MANAGER, screen
-    from scripts.game_structure.discord_rpc import _DiscordRPC
-    from scripts.cat.sprites import sprites
+    from scripts.game_structure import image_cache
     from scripts.clan import clan_class
     from scripts.utility import get_text_box_theme, quit, scale  # pylint: disable=redefined-builtin
     from scripts.debugmode import debugmode
@@ -180,7 +220,7 @@ async def main():
 
     # P Y G A M E
     clock = pygame.time.Clock()
-    pygame.display.set_icon(pygame.image.load('resources/images/icon.png'))
+    pygame.display.set_icon(image_cache.load_image('resources/images/icon.png'))
 
     # LOAD cats & clan
     clan_list = game.read_clans()
@@ -188,8 +228,8 @@ async def main():
         game.switches['clan_list'] = clan_list
         try:
             load_cats()
-            version_info = clan_class.load_clan()
-            version_convert(version_info)
+            clan_version_info = clan_class.load_clan()
+            version_convert(clan_version_info)
         except Exception as e:
             logging.exception("File failed to load")
             if not game.switches['error_message']:
@@ -200,26 +240,26 @@ async def main():
 
     # LOAD settings
 
-    sprites.load_scars()
-
     start_screen.screen_switches()
 
     if game.settings['fullscreen']:
         version_number = pygame_gui.elements.UILabel(
-            pygame.Rect((1500, 1350), (-1, -1)), get_version_info().version_number[0:8],
+            pygame.Rect((1500, 1350), (-1, -1)), short_commit,
             object_id=get_text_box_theme())
         # Adjust position
+        label_rect = version_number.get_relative_rect()
         version_number.set_position(
-            (1600 - version_number.get_relative_rect()[2] - 8,
-            1400 - version_number.get_relative_rect()[3]))
+            (1600 - label_rect[2] - 8,
+            1400 - label_rect[3]))
     else:
         version_number = pygame_gui.elements.UILabel(
-            pygame.Rect((700, 650), (-1, -1)), get_version_info().version_number[0:8],
+            pygame.Rect((700, 650), (-1, -1)), short_commit,
             object_id=get_text_box_theme())
         # Adjust position
+        label_rect = version_number.get_relative_rect()
         version_number.set_position(
-            (800 - version_number.get_relative_rect()[2] - 8,
-            700 - version_number.get_relative_rect()[3]))
+            (800 - label_rect[2] - 8,
+            700 - label_rect[3]))
 
     if web.is_web:
         dev_watermark = pygame_gui.elements.UILabel(
@@ -227,7 +267,7 @@ async def main():
             "Web Build:",
             object_id="#dev_watermark"
         )
-    elif get_version_info().is_source_build or get_version_info().is_dev():
+    elif is_dev_build:
         dev_watermark = pygame_gui.elements.UILabel(
             scale(pygame.Rect((1050, 1321), (600, 100))),
             "Dev Build:",
@@ -235,69 +275,126 @@ async def main():
         )
 
     if not web.is_web:
-        game.rpc = _DiscordRPC("1076277970060185701", daemon=True)
-        game.rpc.start()
-        game.rpc.start_rpc.set()
+        def start_rpc():
+            """Builds and starts the Discord RPC thread off the startup path"""
+            # Only imported here so the web build never pays for the RPC module.
+            from scripts.game_structure.discord_rpc import _DiscordRPC
+            game.rpc = _DiscordRPC("1076277970060185701", daemon=True)
+            game.rpc.start()
+            game.rpc.start_rpc.set()
+
+        # Detached so a slow or absent Discord never delays the first frame.
+        # Call sites treat game.rpc as optional until this lands.
+        asyncio.create_task(asyncio.to_thread(start_rpc))
 
 
-    cursor_img = pygame.image.load('resources/images/cursor.png').convert_alpha()
+    cursor_img = image_cache.load_image('resources/images/cursor.png')
     cursor = pygame.cursors.Cursor((9,0), cursor_img)
     disabled_cursor = pygame.cursors.Cursor(pygame.SYSTEM_CURSOR_ARROW)
-
-
-
+    # Tracks which cursor is set so the loop never has to ask SDL.
+    active_cursor = disabled_cursor
+
+    # Hoisted out of the frame loop. The all_screens dict is filled once at
+    # import and never replaced, so one lookup here is enough. game.settings
+    # can't be cached the same way - the settings screen swaps the whole dict
+    # out when changes are discarded.
+    all_screens = game.all_screens
+    dark_fill = (57, 50, 36)
+    light_fill = (206, 194, 168)
+
+    # Typed event dispatch: one dict lookup per event instead of a chain of
+    # type comparisons in the frame loop.
+    def on_quit(event):
+        # Dont display if on the start screen or there is no clan.
+        if (game.switches['cur_screen'] in ['start screen',
+                                            'switch clan screen',
+                                            'settings screen',
+                                            'info screen',
+                                            'make clan screen']
+            or not game.clan):
+            quit(savesettings=False)
+        else:
+            SaveCheck(game.switches['cur_screen'], False, None)
+
+    def on_mouse_down(event):
+        game.clicked = True
+
+        if MANAGER.visual_debug_active:
+            _ = pygame.mouse.get_pos()
+            if game.settings['fullscreen']:
+                print(f"(x: {_[0]}, y: {_[1]})")
+            else:
+                print(f"(x: {_[0]*2}, y: {_[1]*2})")
+            del _
+
+    def on_key_down(event):
+        # F2 toggles visual debug mode for pygame_gui, allowed for easier bug fixes.
+        if event.key == pygame.K_F2:
+            debugmode.toggle_console()
+
+    event_handlers = {
+        pygame.QUIT: on_quit,
+        pygame.MOUSEBUTTONDOWN: on_mouse_down,
+        pygame.KEYDOWN: on_key_down,
+    }
+
+
+
+
+    last_frame = time.perf_counter()
 
     try:
         while True:
-            time_delta = clock.tick(game.switches['fps']) / 1000.0
-            if game.switches['cur_screen'] not in ['start screen']:
+            # Don't burn CPU rendering frames nobody can see; check again
+            # every quarter second until the tab is visible.
+            if web.is_web and web.window.get("__clangen_visible") is False:
+                await asyncio.sleep(0.25)
+                last_frame = time.perf_counter()
+                continue
+
+            # Pace frames with an awaited sleep instead of clock.tick: SDL's
+            # tick busy-waits, while this hands the idle time back to the
+            # event loop (on web, to the browser). clock still ticks with no
+            # cap so the debug overlay's clock.get_fps() keeps working.
+            now = time.perf_counter()
+            time_delta = now - last_frame
+            fps = game.switches['fps']
+            if fps:  # the debug console's 'fps 0' removes the cap entirely
+                target_delta = 1.0 / fps
+                if time_delta < target_delta:
+                    await asyncio.sleep(target_delta - time_delta)
+                    now = time.perf_counter()
+                    time_delta = now - last_frame
+            last_frame = now
+            clock.tick()
+
+            # game.current_screen only changes inside update_game, so resolve
+            # the active screen object once per frame instead of per event.
+            active_screen = all_screens[game.current_screen]
+
+            # Skip the ~8 MB full-screen fill on screens that repaint
+            # every pixel themselves.
+            if not active_screen.screen_covers_background:
                 if game.settings['dark mode']:
-                    screen.fill((57, 50, 36))
+                    screen.fill(dark_fill)
                 else:
-                    screen.fill((206, 194, 168))
+                    screen.fill(light_fill)
 
-            if game.settings['custom cursor']:
-                if pygame.mouse.get_cursor() == disabled_cursor:
-                    pygame.mouse.set_cursor(cursor)
-            elif pygame.mouse.get_cursor() == cursor:
-                pygame.mouse.set_cursor(disabled_cursor)
+            wanted_cursor = cursor if game.settings['custom cursor'] else disabled_cursor
+            if wanted_cursor is not active_cursor:
+                pygame.mouse.set_cursor(wanted_cursor)
+                active_cursor = wanted_cursor
             # Draw screens
             # This occurs before events are handled to stop pygame_gui buttons from blinking.
-            game.all_screens[game.current_screen].on_use()
+            active_screen.on_use()
 
             # EVENTS
             for event in pygame.event.get():
-                game.all_screens[game.current_screen].handle_event(event)
-
-                if event.type == pygame.QUIT:
-                    # Dont display if on the start screen or there is no clan.
-                    if (game.switches['cur_screen'] in ['start screen',
-                                                        'switch clan screen',
-                                                        'settings screen',
-                                                        'info screen',
-                                                        'make clan screen']
-                        or not game.clan):
-                        quit(savesettings=False)
-                    else:
-                        SaveCheck(game.switches['cur_screen'], False, None)
-
-
-                # MOUSE CLICK
-                if event.type == pygame.MOUSEBUTTONDOWN:
-                    game.clicked = True
-
-                    if MANAGER.visual_debug_active:
-                        _ = pygame.mouse.get_pos()
-                        if game.settings['fullscreen']:
-                            print(f"(x: {_[0]}, y: {_[1]})")
-                        else:
-                            print(f"(x: {_[0]*2}, y: {_[1]*2})")
-                        del _
-
-                # F2 turns toggles visual debug mode for pygame_gui, allowed for easier bug fixes.
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_F2:
-                        debugmode.toggle_console()
+                active_screen.handle_event(event)
+
+                handler = event_handlers.get(event.type)
+                if handler:
+                    handler(event)
 
                 MANAGER.process_events(event)
             
@@ -307,27 +404,35 @@ async def main():
             # update
             game.update_game()
             if game.switch_screens:
-                game.all_screens[game.last_screen_forupdate].exit_screen()
-                game.all_screens[game.current_screen].screen_switches()
+                all_screens[game.last_screen_forupdate].exit_screen()
+                all_screens[game.current_screen].screen_switches()
                 game.switch_screens = False
 
 
-            debugmode.update1(clock)
+            if debugmode.enabled:
+                debugmode.update1(clock)
             # END FRAME
             MANAGER.draw_ui(screen)
-            debugmode.update2(screen)
+            if debugmode.enabled:
+                debugmode.update2(screen)
 
 
             pygame.display.update()
         
             await asyncio.sleep(0)
     except Exception:
+        # One handler path for game-loop crashes: on desktop re-raise so
+        # sys.excepthook (log_crash) runs; on web log here, then offer the
+        # console since the page has nowhere to re-raise to.
         if web.is_web:
+            logging.exception("Uncaught exception in the game loop")
             web.eval("""
             if (confirm('An error has occurred. Would you like to open the console?')) {
                 debug();
-            else {
+            } else {
                 window.location.reload();
             }""")
+        else:
+            raise
 
 asyncio.run(main())
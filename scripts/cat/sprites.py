@@ -19,6 +19,7 @@ class Sprites():
         self.images = {}
         self.groups = {}
         self.sprites = {}
+        self.scars_loaded = False
 
         self.load_tints()
 
@@ -116,8 +117,13 @@ class Sprites():
 
     def load_scars(self):
         """
-        Loads scar sprites and puts them into groups.
+        Loads scar sprites and puts them into groups. Deferred until the
+        first cat-render so the start/settings screens never pay for it;
+        safe to call repeatedly.
         """
+        if self.scars_loaded:
+            return
+        self.scars_loaded = True
         for a, i in enumerate(
                 ["ONE", "TWO", "THREE", "MANLEG", "BRIGHTHEART", "MANTAIL", 
                  "BRIDGE", "RIGHTBLIND", "LEFTBLIND", "BOTHBLIND", "BURNPAWS", "BURNTAIL"]):
@@ -380,5 +386,3 @@ for a, i in enumerate(['DARK', 'DARKGREY', 'GREY', 'DARKSALMON', 'SALMON', 'PEAC
     sprites.make_group('skin', (a, 1), f"skin{i}")
 for a, i in enumerate(['DARKMARBLED', 'MARBLED', 'LIGHTMARBLED', 'DARKBLUE', 'BLUE', 'LIGHTBLUE']):
     sprites.make_group('skin', (a, 2), f"skin{i}")
-
-sprites.load_scars()
@@ -275,6 +275,10 @@ class debugMode:
             "visualdebugmode": False,
             "showfps": False
         }
+        # Checked by the main loop so update1/update2 cost nothing per frame
+        # while the debug UI is idle. Starts True so the first update1 pass
+        # normalizes the overlay state, then recomputes itself.
+        self.enabled = True
 
         self.coords_display = pygame_gui.elements.UILabel(
             pygame.Rect((0, 0), (-1, -1)),
@@ -302,6 +306,7 @@ class debugMode:
 
     def toggle_console(self):
         if self.console.visible == 0:
+            self.enabled = True
             self.console.show()
             self.console.command_entry.focus()
             self.console.set_blocking(True)
@@ -358,6 +363,11 @@ class debugMode:
             if MANAGER.visual_debug_active:
                 MANAGER.set_visual_debug_mode(False)
 
+        # Everything above is now in its off state, so the main loop can stop
+        # calling in until the console (re)enables a debug setting. Stays True
+        # while the console is open since commands can flip settings any time.
+        self.enabled = any(self.settings.values()) or bool(self.console.visible)
+
 
     def update2(self, screen):
 
@@ -1,14 +1,65 @@
+import os
+import threading
+
 import pygame
-from scripts.platformwrapper import is_web
+
+try:
+    import ujson
+except ImportError:
+    import json as ujson
+
+ATLAS_IMAGE = "resources/images/atlas.png"
+ATLAS_MAP = "resources/images/atlas.json"
 
 _images = {}
+_lock = threading.Lock()
+
+def _load_atlas():
+    """
+    If a packed atlas is shipped (built by scripts/tools/pack_atlas.py),
+    pre-populates the cache with subsurface views into the one master sheet,
+    so each packed image costs a rect lookup instead of its own PNG decode.
+    """
+    if not (os.path.exists(ATLAS_IMAGE) and os.path.exists(ATLAS_MAP)):
+        return
+    master = pygame.image.load(ATLAS_IMAGE)
+    with open(ATLAS_MAP, "r", encoding="utf-8") as read_file:
+        regions = ujson.loads(read_file.read())
+    for path, (x, y, w, h) in regions.items():
+        _images[os.path.normpath(path)] = master.subsurface(pygame.Rect(x, y, w, h))
+
+_load_atlas()
+
 def load_image(path):
     """
     If not in the cache already, loads the image from path as a surface.
     Otherwise, the image is retrieved from the cache.
     """
-    if is_web:
-        return pygame.image.load(path)
-    if path not in _images:
-        _images[path] = pygame.image.load(path)
-    return _images[path]
+    # Normalize so "resources/a.png" and "./resources/a.png" (or backslashed
+    # variants on Windows) share one cache entry instead of double-storing.
+    key = os.path.normpath(path)
+    image = _images.get(key)
+    if image is None:
+        # Double-checked so the common hit path stays lock-free; the lock
+        # only guards against two threads decoding the same file at once.
+        with _lock:
+            image = _images.get(key)
+            if image is None:
+                image = pygame.image.load(key)
+                try:
+                    # Convert once at insertion so every later blit skips the
+                    # per-pixel format conversion.
+                    image = image.convert_alpha()
+                except pygame.error:
+                    # No display yet - store the raw surface instead.
+                    pass
+                _images[key] = image
+    return image
+
+def warm_cache(paths):
+    """
+    Pre-loads and converts a batch of images. Call after the display exists
+    so first blits of common UI sprites pay neither decode nor conversion.
+    """
+    for path in paths:
+        load_image(path)
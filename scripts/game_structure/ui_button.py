@@ -1,4 +1,5 @@
 """Python module for generating a button surface, based off of image_button.UISpriteButton"""
+from __future__ import annotations
 # pylint: disable=too-many-arguments, line-too-long, pointless-string-statement, missing-function-docstring
 """Editing Guide:
 Text / Symbol color: 
@@ -67,12 +68,13 @@ Change default color palette(s):
         palette[3]:  Button fill
         palette[4]:  Button shadow      
 """
+import functools
 import pygame
 import pygame_gui
 import warnings
 import re
-import i18n
-from typing import Union, Tuple, Dict, Optional
+from typing import Dict, Optional
+from collections import OrderedDict
 import scripts.game_structure.image_button
 from scripts.game_structure.game_essentials import MANAGER
 from scripts.platformwrapper import is_web
@@ -86,6 +88,35 @@ pygame.font.init()
 DEBUG = False
 FONT = pygame.font.Font('resources/fonts/clangen.ttf', 16)
 COLOR = (239, 229, 206)
+# matches embedded symbol tokens like {DICE}; compiled once instead of
+# re-splitting per line in _build_text
+_SYM_RE = re.compile(r'\{[^}]+\}')
+# rendered text chunks, keyed by (chunk, color); the same labels come up
+# over and over, so hit this before asking SDL_ttf to rasterize again.
+# LRU-bounded like the other caches so dynamic labels cannot grow it
+# without limit
+_TEXT_CACHE: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+_TEXT_CACHE_MAX = 1024
+
+def _render_text(chunk: str) -> pygame.Surface:
+    """Renders a text chunk with FONT, reusing previously rendered surfaces
+
+    Args:
+        chunk (str): The text to render
+
+    Returns:
+        pygame.Surface: The rendered text
+    """
+    key = (chunk, COLOR)
+    surface = _TEXT_CACHE.get(key)
+    if surface is None:
+        surface = FONT.render(chunk, False, COLOR)
+        _TEXT_CACHE[key] = surface
+        if len(_TEXT_CACHE) > _TEXT_CACHE_MAX:
+            _TEXT_CACHE.popitem(last=False)
+    else:
+        _TEXT_CACHE.move_to_end(key)
+    return surface
 
 if is_web:
     FONT = pygame.font.SysFont(None, 24)
@@ -93,9 +124,13 @@ if is_web:
 class _Language():
     """Class for rendering button text in other languages, from languages/.*/buttons.json"""
     LANGUAGE = "en-us"
-    i18n.load_path.append('languages/buttons')
-    i18n.set('file_format', 'json')
-    i18n.set('locale', LANGUAGE)
+    # translation tables, one dict per locale, loaded once from
+    # languages/buttons/buttons.<locale>.json instead of resolving
+    # through the i18n library on every lookup
+    _table: Dict[str, dict] = {}
+    # object_ids already warned about; warnings.warn walks the stack and
+    # runs the filter machinery, so only pay that once per miss
+    _warned: set = set()
     # global dictionary for symbol lookup
     dict_global = {
         "#cat_tab_3_blank_button": "",
@@ -119,6 +154,20 @@ class _Language():
         "#exit_window_button": "{EXIT}",
     }
 
+    @staticmethod
+    def _load(locale: str) -> dict:
+        """Loads languages/buttons/buttons.<locale>.json into _Language._table
+
+        Args:
+            locale (str): The locale to load, must be in languages/buttons/
+
+        Returns:
+            dict: The loaded translation table
+        """
+        with open(f"languages/buttons/buttons.{locale}.json", "rb") as file:
+            _Language._table[locale] = ujson.loads(file.read()).get(locale, {})
+        return _Language._table[locale]
+
     @staticmethod
     def set_language(language: str) -> None:
         """Sets the language to be used for button text
@@ -130,10 +179,12 @@ class _Language():
         if language not in supported_languages:
             raise ValueError("Language not supported")
         _Language.LANGUAGE = language
-        i18n.set('locale', language)
+        _Language._load(language)
+        if language != "en-us":
+            _Language._load("en-us") # fallback table
 
     @staticmethod
-    def check(object_id: Union[str, None]) -> str:
+    def check(object_id: str | None) -> str:
         """Checks if the object_id is in the dictionary, and returns the appropriate string (if found)
 
         Args:
@@ -145,9 +196,11 @@ class _Language():
         """
         if object_id is None:
             return ''
-        search_term = f"buttons.{object_id}"
-        translated = i18n.t(search_term, locale=_Language.LANGUAGE)
-        if translated != search_term:
+        table = _Language._table.get(_Language.LANGUAGE)
+        if table is None:
+            table = _Language._load(_Language.LANGUAGE)
+        translated = table.get(object_id)
+        if translated is not None:
             return translated
         # backup search for global
         search = _Language.dict_global.get(object_id)
@@ -156,59 +209,97 @@ class _Language():
         if "checkbox" in object_id:
             return '' # silently return just so it doesn't yell at you, checkbox is supposed to be blank :)
         if _Language.LANGUAGE == 'en-us':
-            warnings.warn('text (en-us) for not found! ' + object_id)
+            if object_id not in _Language._warned:
+                _Language._warned.add(object_id)
+                warnings.warn('text (en-us) for not found! ' + object_id)
         else:
-            warnings.warn(f'Translation for "{object_id}" in {_Language.LANGUAGE} not found! Using fallback language "en-us"')
-            return i18n.t(search_term, locale='en-us')
+            if object_id not in _Language._warned:
+                _Language._warned.add(object_id)
+                warnings.warn(f'Translation for "{object_id}" in {_Language.LANGUAGE} not found! Using fallback language "en-us"')
+            fallback = _Language._table.get('en-us')
+            if fallback is None:
+                fallback = _Language._load('en-us')
+            return fallback.get(object_id, '')
         return ''
 
+class _SymbolDict(dict):
+    """dict that materializes symbol surfaces from _Symbol._paths on first access"""
+    def __missing__(self, key):
+        source = _Symbol._flipped.get(key)
+        if source is not None:
+            # mirror of another symbol: reuse its cached load instead of
+            # reading and recoloring the image a second time
+            surface = pygame.transform.flip(self[source], True, False)
+            self[key] = surface
+            return surface
+        path = _Symbol._paths.get(key)
+        if path is None:
+            raise KeyError(key)
+        if is_web:
+            surface = _Symbol._web_load(path)
+        else:
+            surface = _Symbol.load(path)
+        self[key] = surface
+        return surface
+    def get(self, key, default=None):
+        # plain dict.get bypasses __missing__, so route through __getitem__
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
 class _Symbol():
-    """Custom class for rendering symbols from an image file"""
+    """Custom class for rendering symbols from an image file
+
+    Symbols are loaded lazily: custom maps {SYMBOL_NAME} to a surface,
+    loading and recoloring the image the first time a symbol is used
+    instead of reading all of them at import.
+    """
     _color = pygame.Color(COLOR)
-    custom = {}
-    @staticmethod
-    def __init__() -> None:
-        """Populates _Symbol.custom with the appropriate custom symbols"""
-        _Symbol.custom["{DICE}"] = _Symbol.load("resources/images/symbols/random_dice.png")
-        _Symbol.custom["{ARROW_LEFT_SHORT}"] = _Symbol.load("resources/images/symbols/arrow_short.png")
-        _Symbol.custom["{ARROW_RIGHT_SHORT}"] = pygame.transform.flip(_Symbol.load("resources/images/symbols/arrow_short.png"), True, False)
-        _Symbol.custom["{ARROW_LEFT_MED}"] = _Symbol.load("resources/images/symbols/arrow_medium.png")
-        _Symbol.custom["{ARROW_RIGHT_MED}"] = pygame.transform.flip(_Symbol.load("resources/images/symbols/arrow_medium.png"), True, False)
-        _Symbol.custom["{PATROL_CLAW}"] = _Symbol.load("resources/images/symbols/patrol_claws.png")
-        _Symbol.custom["{PATROL_PAW}"] = _Symbol.load("resources/images/symbols/patrol_paw.png")
-        _Symbol.custom["{PATROL_MOUSE}"] = _Symbol.load("resources/images/symbols/patrol_mouse.png")
-        _Symbol.custom["{PATROL_HERB}"] = _Symbol.load("resources/images/symbols/patrol_herb.png")
-        _Symbol.custom["{YOUR_CLAN}"] = _Symbol.load("resources/images/symbols/your_clan.png")
-        _Symbol.custom["{OUTSIDE_CLAN}"] = _Symbol.load("resources/images/symbols/outside_clan.png")
-        _Symbol.custom["{STARCLAN}"] = _Symbol.load("resources/images/symbols/starclan.png")
-        _Symbol.custom["{UNKNOWN_RESIDENCE}"] = _Symbol.load("resources/images/symbols/unknown_residence.png")
-        _Symbol.custom["{DARK_FOREST}"] = _Symbol.load("resources/images/symbols/dark_forest.png")
-        _Symbol.custom["{LEADER_CEREMONY}"] = _Symbol.load("resources/images/symbols/leader_ceremony.png")
-        _Symbol.custom["{MEDIATION}"] = _Symbol.load("resources/images/symbols/mediation.png")
-        _Symbol.custom["{EXIT}"] = _Symbol.load("resources/images/symbols/exit.png")
-        _Symbol.custom["{CHECKMARK}"] = _Symbol.load("resources/images/symbols/checkbox_checkmark.png")
+    # precomputed RGB tuple so the recolor fills don't rebuild it per load
+    _color_rgb = tuple(_color)[0:3]
+    _paths = {
+        "{DICE}": "resources/images/symbols/random_dice.png",
+        "{ARROW_LEFT_SHORT}": "resources/images/symbols/arrow_short.png",
+        "{ARROW_LEFT_MED}": "resources/images/symbols/arrow_medium.png",
+        "{PATROL_CLAW}": "resources/images/symbols/patrol_claws.png",
+        "{PATROL_PAW}": "resources/images/symbols/patrol_paw.png",
+        "{PATROL_MOUSE}": "resources/images/symbols/patrol_mouse.png",
+        "{PATROL_HERB}": "resources/images/symbols/patrol_herb.png",
+        "{YOUR_CLAN}": "resources/images/symbols/your_clan.png",
+        "{OUTSIDE_CLAN}": "resources/images/symbols/outside_clan.png",
+        "{STARCLAN}": "resources/images/symbols/starclan.png",
+        "{UNKNOWN_RESIDENCE}": "resources/images/symbols/unknown_residence.png",
+        "{DARK_FOREST}": "resources/images/symbols/dark_forest.png",
+        "{LEADER_CEREMONY}": "resources/images/symbols/leader_ceremony.png",
+        "{MEDIATION}": "resources/images/symbols/mediation.png",
+        "{EXIT}": "resources/images/symbols/exit.png",
+        "{CHECKMARK}": "resources/images/symbols/checkbox_checkmark.png",
+    }
+    # symbols that are a horizontal mirror of another symbol
+    _flipped = {
+        "{ARROW_RIGHT_SHORT}": "{ARROW_LEFT_SHORT}",
+        "{ARROW_RIGHT_MED}": "{ARROW_LEFT_MED}",
+    }
+    custom = _SymbolDict()
 
     @staticmethod
-    def populate() -> None:
-        """Temporary class for populating _Symbol.custom on the web build, testing a different recolor method"""
-        _Symbol.custom["{DICE}"] = _Symbol._web_load("resources/images/symbols/random_dice.png")
-        _Symbol.custom["{ARROW_LEFT_SHORT}"] = _Symbol._web_load("resources/images/symbols/arrow_short.png")
-        _Symbol.custom["{ARROW_RIGHT_SHORT}"] = pygame.transform.flip(_Symbol._web_load("resources/images/symbols/arrow_short.png"), True, False)
-        _Symbol.custom["{ARROW_LEFT_MED}"] = _Symbol._web_load("resources/images/symbols/arrow_medium.png")
-        _Symbol.custom["{ARROW_RIGHT_MED}"] = pygame.transform.flip(_Symbol._web_load("resources/images/symbols/arrow_medium.png"), True, False)
-        _Symbol.custom["{PATROL_CLAW}"] = _Symbol._web_load("resources/images/symbols/patrol_claws.png")
-        _Symbol.custom["{PATROL_PAW}"] = _Symbol._web_load("resources/images/symbols/patrol_paw.png")
-        _Symbol.custom["{PATROL_MOUSE}"] = _Symbol._web_load("resources/images/symbols/patrol_mouse.png")
-        _Symbol.custom["{PATROL_HERB}"] = _Symbol._web_load("resources/images/symbols/patrol_herb.png")
-        _Symbol.custom["{YOUR_CLAN}"] = _Symbol._web_load("resources/images/symbols/your_clan.png")
-        _Symbol.custom["{OUTSIDE_CLAN}"] = _Symbol._web_load("resources/images/symbols/outside_clan.png")
-        _Symbol.custom["{STARCLAN}"] = _Symbol._web_load("resources/images/symbols/starclan.png")
-        _Symbol.custom["{UNKNOWN_RESIDENCE}"] = _Symbol._web_load("resources/images/symbols/unknown_residence.png")
-        _Symbol.custom["{DARK_FOREST}"] = _Symbol._web_load("resources/images/symbols/dark_forest.png")
-        _Symbol.custom["{LEADER_CEREMONY}"] = _Symbol._web_load("resources/images/symbols/leader_ceremony.png")
-        _Symbol.custom["{MEDIATION}"] = _Symbol._web_load("resources/images/symbols/mediation.png")
-        _Symbol.custom["{EXIT}"] = _Symbol._web_load("resources/images/symbols/exit.png")
-        _Symbol.custom["{CHECKMARK}"] = _Symbol._web_load("resources/images/symbols/checkbox_checkmark.png")
+    def set_color(new_color) -> None:
+        """Changes the symbol/text color and drops everything rendered with the old one
+
+        Args:
+            new_color: The new color, anything pygame.Color accepts
+        """
+        global COLOR
+        _Symbol._color = pygame.Color(new_color)
+        _Symbol._color_rgb = tuple(_Symbol._color)[0:3]
+        COLOR = _Symbol._color_rgb
+        # cached symbols, rasterized text and finished button surfaces
+        # baked in the old color; they rebuild lazily with the new one
+        _Symbol.custom.clear()
+        _TEXT_CACHE.clear()
+        _build_button.cache_clear()
+        ButtonCache._cache.clear()
 
     @staticmethod
     def load(image_path: str) -> pygame.Surface:
@@ -221,10 +312,17 @@ class _Symbol():
             pygame.Surface: updated image to match color
         """
         surface = pygame.image.load(image_path).convert_alpha()
-        pixel_array = pygame.PixelArray(surface)
-        pixel_array.replace((0, 0, 0, 255), _Symbol._color)
-        pixel_array.close()
-        del pixel_array
+        if any(name in image_path for name in ["dark_forest", "checkbox"]):
+            # these two contain detail colors besides pure black, so only
+            # the exact (0, 0, 0, 255) pixels may be swapped
+            pixel_array = pygame.PixelArray(surface)
+            pixel_array.replace((0, 0, 0, 255), _Symbol._color)
+            pixel_array.close()
+            return surface
+        # everything else is black-on-transparent, so two C-level blend
+        # fills recolor it without a Python-level per-pixel loop
+        surface.fill((0, 0, 0, 255), None, pygame.BLEND_RGBA_MULT)
+        surface.fill(_Symbol._color_rgb + (0,), None, pygame.BLEND_RGBA_ADD)
         return surface
 
     @staticmethod
@@ -242,50 +340,64 @@ class _Symbol():
             return surface
         image = surface.copy()
         image.fill((0, 0, 0, 255), None, pygame.BLEND_RGBA_MULT)
-        image.fill(COLOR[0:3] + (0,), None, pygame.BLEND_RGBA_ADD)
+        image.fill(_Symbol._color_rgb + (0,), None, pygame.BLEND_RGBA_ADD)
         return image
 
+# shared default style tuples, so the common no-custom-style case hands
+# out the same object every time instead of a fresh list literal
+_DEFAULT_ROUND = (True, True, True, True)
+_DEFAULT_SHADOW = (True, True, False, False)
+
 class _Style():
     """Class for parsing resources/styles.json, and determining custom styles from the #object_id"""
-    _styles = ujson.load(open("resources/styles.json", "r", encoding="utf-8"))
-    styles_round = _styles["rounded"]
+    # parse from bytes - ujson is faster without the text-decode pass -
+    # and actually close the file handle
+    with open("resources/styles.json", "rb") as _styles_file:
+        _styles = ujson.loads(_styles_file.read())
+    del _styles_file
+    # pre-normalize everything to 4-tuples once, so the check_* lookups
+    # do no isinstance dispatch at call time
+    styles_round = {
+        key: tuple(value) if isinstance(value, list) and len(value) == 4 else (value,)*4
+        for key, value in _styles["rounded"].items()
+    }
     styles_hanging = _styles["hanging"]
-    styles_shadow = _styles["shadow"]
+    styles_shadow = {
+        key: tuple(value)
+        for key, value in _styles["shadow"].items()
+        if isinstance(value, list) and len(value) == 4
+    }
     @staticmethod
-    def check_round(object_id: str) -> list:
+    def check_round(object_id: str) -> tuple:
         """Checks the stylesheet to find if #object_id has rounded corners, if any
 
         Args:
             object_id (str): #object_id from UIButton
 
         Returns:
-            list: List for rounded_corners, if found. 
-            default: [True, True, True, True]
+            tuple: Tuple for rounded_corners, if found.
+            default: (True, True, True, True)
         """
-        style = _Style.styles_round.get(object_id)
-        if style is not None:
-            if isinstance(style, list) and len(style) == 4:
-                return style
-            elif isinstance(style, bool):
-                return [style, style, style, style]
-        return [True, True, True, True]
+        return _Style.styles_round.get(object_id, _DEFAULT_ROUND)
     @staticmethod
     def check_hanging(object_id) -> bool:
-        if object_id is None:
-            return False
-        style = _Style.styles_hanging.get(object_id)
-        if style is not None:
-            return style
-        return False
+        return _Style.styles_hanging.get(object_id, False)
     @staticmethod
-    def check_shadow(object_id) -> list:
-        if object_id is None:
-            return [True, True, False, False]
-        style = _Style.styles_shadow.get(object_id)
-        if style is not None:
-            if isinstance(style, list) and len(style) == 4:
-                return style
-        return [True, True, False, False]
+    def check_shadow(object_id) -> tuple:
+        return _Style.styles_shadow.get(object_id, _DEFAULT_SHADOW)
+    @staticmethod
+    def lookup(object_id) -> tuple:
+        """Resolves all three style axes for #object_id in one call
+
+        Args:
+            object_id (str): #object_id from UIButton
+
+        Returns:
+            tuple: (rounded_corners, hanging, shadows)
+        """
+        return (_Style.styles_round.get(object_id, _DEFAULT_ROUND),
+                _Style.styles_hanging.get(object_id, False),
+                _Style.styles_shadow.get(object_id, _DEFAULT_SHADOW))
 
 class Palette():
     """Internal class that allows for easy access to default color palettes"""
@@ -300,133 +412,221 @@ class Palette():
     ]
 
 class ButtonCache():
-    """Custom class that allows for caching of pygame.Surface objects, and their attributes"""
-    _storage = []
+    """Custom class that allows for caching of pygame.Surface objects, keyed by what they were built from
+
+    Bounded LRU: the least recently used entry is evicted once _MAX
+    combinations are stored, so long sessions with heavy screen churn
+    cannot grow the cache without limit. Buttons that are still alive
+    keep their own references to their sprites, so eviction only drops
+    the shared cache entry.
+    """
+    _cache: OrderedDict = OrderedDict()
+    _MAX = 512
+    @staticmethod
+    def _key(object_id, size, text, hover, unavailable) -> tuple:
+        """Canonicalizes the parameters that identify a rendered button into a hashable key"""
+        return (object_id, tuple(size) if size is not None else None, text, bool(hover), bool(unavailable))
+    @staticmethod
+    def load_by_key(key: tuple) -> pygame.Surface | None:
+        """Cache lookup for callers that already hold a canonical key"""
+        surface = ButtonCache._cache.get(key)
+        if surface is not None:
+            ButtonCache._cache.move_to_end(key)
+        return surface
+    @staticmethod
+    def store_by_key(key: tuple, surface) -> pygame.Surface:
+        """Cache store for callers that already hold a canonical key"""
+        if is_web:
+            return surface
+        ButtonCache._cache[key] = surface
+        if len(ButtonCache._cache) > ButtonCache._MAX:
+            ButtonCache._cache.popitem(last=False)
+        return surface
     @staticmethod
-    # pylint: disable=unused-argument
     def load_button(object_id: str = "",
+                    size: tuple = None,
+                    text: str = "",
                     hover: bool = False,
-                    unavailable: bool = False) -> Union[None, pygame.Surface]:
+                    unavailable: bool = False) -> pygame.Surface | None:
         """Attempts to load a button surface from the cache
 
         Args:
+            object_id (str): The #object_id the surface was built for
             size (tuple): The size of the surface to search for
             text (str, optional): The text on the surface. Defaults to "".
             hover (bool, optional): If the button is in the hovered state. Defaults to False.
             unavailable (bool, optional): If the button is disabled. Defaults to False.
-            rounded_corners (Union[bool, list], optional): List of which corners should be rounded on the button, following 9-slice. Defaults to [True, True, True, True].
-            shadows (Union[bool, list], optional): List of which edges should have shadows, following 9-slice. Defaults to [True, True, False, False].
-            hanging (bool, optional): If the image should have 2 "ropes" on either side. Defaults to False.
 
         Returns:
-            Union[bool, pygame.Surface]: The cached button surface
+            pygame.Surface: The cached button surface
             default: None
         """
-        kwargs = locals()
-        keys = ["size", "text", "hover", "unavailable", "rounded_corners", "shadows", "hanging"]
-        obj = [
-               item for item in ButtonCache._storage
-               if all(key in kwargs and kwargs[key] == item[key] for key in keys)]
-        del kwargs, keys
-        if len(obj) != 0:
-            return obj[0]
-        del obj
-        return None
+        return ButtonCache.load_by_key(ButtonCache._key(object_id, size, text, hover, unavailable))
     @staticmethod
     def store_button(surface,
                      object_id: str = "",
+                     size: tuple = None,
+                     text: str = "",
                      hover: bool = False,
                      unavailable: bool = False) -> pygame.Surface:
-        """Stores a surface to the cache list
+        """Stores a surface to the cache
 
         Args:
             surface (pygame.Surface): The surface to store
-            size (tuple): The size of the surface to save, old feature but still used
+            object_id (str): The #object_id the surface was built for
+            size (tuple): The size of the surface to save
             text (str, optional): The text on the surface. Defaults to "".
             hover (bool, optional): If the button is in the hovered state. Defaults to False.
             unavailable (bool, optional): If the button is disabled. Defaults to False.
-            rounded_corners (Union[bool, list], optional): List of which corners should be rounded on the button, following 9-slice. Defaults to [True, True, True, True].
-            shadows (Union[bool, list], optional): List of which edges should have shadows, following 9-slice. Defaults to [True, True, False, False].
-            hanging (bool, optional): If the image should have 2 "ropes" on either side. Defaults to False.
 
         Returns:
             pygame.Surface: The stored surface, just to make calls easier for me
         """
-        if is_web:
-            return surface
-        store = {
-            "surface": surface,
-            "hover": hover,
-            "unavailable": unavailable,
-            "object_id": object_id
-        }
-        ButtonCache._storage.append(store)
-        del store
-        return surface
+        return ButtonCache.store_by_key(
+            ButtonCache._key(object_id, size, text, hover, unavailable), surface)
 
 class UIButton(scripts.game_structure.image_button.UISpriteButton):
     """TODO: document"""
+    # the base class still carries a __dict__, but slotted access to the
+    # attributes touched on every build/state change skips it
+    __slots__ = ('relative_rect', 'id', 'rounded_corners', 'hanging', 'shadows',
+                 'state', 'text', '_sprites', '_keys', '_state_images', 'button', '_visible',
+                 '_dynamic_dimensions_orig_top_left', '_rect_value', '_blit_data')
     def __init__(self, relative_rect, text = "", visible=1, starting_height=1, object_id=None,
                  manager=MANAGER, container=None, tool_tip_text=None):
         """TODO: document"""
         self.relative_rect = relative_rect
         self.id = object_id
-        self.rounded_corners = _Style.check_round(object_id)
-        self.hanging = _Style.check_hanging(object_id)
-        self.shadows = _Style.check_shadow(object_id)
+        self.rounded_corners, self.hanging, self.shadows = _Style.lookup(object_id)
 
         self.state = "default"
         if text != "":
             self.text = text
         else:
             self.text = _Language.check(object_id)
-        cache = ButtonCache.load_button(object_id=object_id, hover=False, unavailable=False)
-        if cache:
-            sprite = cache['surface']
-        else:
-            sprite = ButtonCache.store_button(
-                        Button.new(size=relative_rect.size, 
-                                   text=self.text, 
-                                   rounded_corners=self.rounded_corners, 
-                                   hanging=self.hanging, 
-                                   shadows=self.shadows, 
-                                   object_id=object_id),
-                        object_id, hover=False, unavailable=False)
-        self.image = pyggui_UIImage(relative_rect,
-                                    pygame.transform.scale(sprite, relative_rect.size),
-                                    visible=visible,
-                                    manager=manager,
-                                    container=container,
-                                    object_id=object_id,
-                                    starting_height=starting_height)
-        self.image.disable()
+        # one sprite per state, shared between instances through
+        # ButtonCache; state changes in CatButton then just swap which
+        # sprite is shown instead of re-invoking the builder
+        self._sprites = {}
+        self._keys = {}
+        for state, hover, unavailable in (("default", False, False),
+                                          ("hover", True, False),
+                                          ("unavailable", False, True)):
+            # canonicalize the cache key once per state and keep it around
+            key = ButtonCache._key(object_id, relative_rect.size, self.text, hover, unavailable)
+            self._keys[state] = key
+            sprite = ButtonCache.load_by_key(key)
+            if not sprite:
+                sprite = ButtonCache.store_by_key(
+                            key,
+                            Button.new(size=relative_rect.size,
+                                       text=self.text,
+                                       hover=hover,
+                                       unavailable=unavailable,
+                                       rounded_corners=self.rounded_corners,
+                                       hanging=self.hanging,
+                                       shadows=self.shadows,
+                                       object_id=object_id))
+            # Button.new already renders at relative_rect.size; only rescale
+            # the odd sprite out (e.g. the fixed-size checkbox art)
+            if sprite.get_size() != relative_rect.size:
+                sprite = pygame.transform.scale(sprite, relative_rect.size)
+            self._sprites[state] = sprite
+        # one UIImage per state, stacked at the same rect; state changes
+        # then toggle visibility flags instead of pushing a new surface
+        # through pygame_gui's set_image path
+        self._state_images = {}
+        for state, sprite in self._sprites.items():
+            image = pyggui_UIImage(relative_rect,
+                                   sprite,
+                                   visible=visible if state == "default" else 0,
+                                   manager=manager,
+                                   container=container,
+                                   object_id=object_id,
+                                   starting_height=starting_height)
+            image.disable()
+            self._state_images[state] = image
         # The transparent button. This a subclass that UIButton that also hold the cat_id.
         self.button = CatButton(relative_rect, visible=visible,
                                 starting_height=starting_height+1,
                                 manager=manager, tool_tip_text=tool_tip_text,
                                 internal=self, container=container)
         self.visible = visible
-    def __setattr__(self, name, value):
-        self.__dict__[name] = value
-        if name == "visible":
-            self.image.visible = value
-            self.button.visible = value
-        elif name == "dynamic_dimensions_orig_top_left":
-            self.image.dynamic_dimensions_orig_top_left = value
-            self.button.dynamic_dimensions_orig_top_left = value
-        elif name == "_rect":
-            self.image._rect = value
-            self.button._rect = value
-        elif name == "blit_data":
-            self.image.blit_data = value
-            self.button.blit_data = value
+    @property
+    def image(self):
+        """The UIImage showing the current state, for code that pokes at it directly"""
+        return self._state_images[self.state]
+
+    # only these four names need to be mirrored onto the wrapped image and
+    # button elements; explicit properties keep every other attribute
+    # assignment a plain store instead of funnelling all of __init__
+    # through a __setattr__ dispatch chain
+    @property
+    def visible(self):
+        return self._visible
+    @visible.setter
+    def visible(self, value):
+        self._visible = value
+        for state, image in self._state_images.items():
+            image.visible = value if state == self.state else 0
+        self.button.visible = value
+
+    @property
+    def dynamic_dimensions_orig_top_left(self):
+        return self._dynamic_dimensions_orig_top_left
+    @dynamic_dimensions_orig_top_left.setter
+    def dynamic_dimensions_orig_top_left(self, value):
+        self._dynamic_dimensions_orig_top_left = value
+        for image in self._state_images.values():
+            image.dynamic_dimensions_orig_top_left = value
+        self.button.dynamic_dimensions_orig_top_left = value
+
+    @property
+    def _rect(self):
+        return self._rect_value
+    @_rect.setter
+    def _rect(self, value):
+        self._rect_value = value
+        # assign through the rect property so each sprite's blit_data
+        # stays in sync with its new rect
+        for image in self._state_images.values():
+            image.rect = value
+        self.button.rect = value
+
+    @property
+    def blit_data(self):
+        return self._blit_data
+    @blit_data.setter
+    def blit_data(self, value):
+        self._blit_data = value
+        for image in self._state_images.values():
+            image.blit_data = value
+        self.button.blit_data = value
 
     def rebuild(self):
-        self.image.rebuild()
+        for image in self._state_images.values():
+            image.rebuild()
         self.button.rebuild()
 
+    def kill(self):
+        self.button.kill()
+        for image in self._state_images.values():
+            image.kill()
+        del self
+
+    @staticmethod
+    def blit_many(surface, items) -> None:
+        """Blits a batch of buttons' current sprites in one fblits call
+
+        Args:
+            surface (pygame.Surface): The destination surface
+            items: Iterable of (UIButton, (x, y)) pairs
+        """
+        surface.fblits([(button._sprites[button.state], pos) for button, pos in items])
+
 class CatButton(pygame_gui.elements.UIButton):
     """TODO: document"""
+    __slots__ = ('rounded_corners', 'hanging', 'shadows', 'internal', 'hover')
 
     def __init__(self,
                  relative_rect,
@@ -448,78 +648,33 @@ class CatButton(pygame_gui.elements.UIButton):
                          manager=manager,
                          tool_tip_text=tool_tip_text,
                          container=container)
+    def _set_state(self, state: str) -> None:
+        """Shows the prebuilt image for the given state by flipping visibility flags"""
+        internal = self.internal
+        if state == internal.state:
+            return
+        images = internal._state_images
+        current = images[internal.state]
+        # carry over the actual visibility so hidden buttons stay hidden
+        images[state].visible = current.visible
+        current.visible = 0
+        internal.state = state
     def on_hovered(self):
         self.hover = True
-        cache = ButtonCache.load_button(
-            object_id=self.internal.id, hover=True, unavailable=False
-        )
-        if cache:
-            sprite = cache['surface']
-        else:
-            sprite = ButtonCache.store_button(
-                Button.new(size=self.relative_rect.size,
-                           text=self.internal.text, hover=True,
-                           rounded_corners=self.rounded_corners,
-                           hanging=self.hanging, shadows=self.shadows,
-                           object_id=self.internal.id),
-                object_id=self.internal.id, hover=True, unavailable=False
-            )
-        self.internal.image.set_image(pygame.transform.scale(sprite, self.relative_rect.size))
+        self._set_state("hover")
         super().on_hovered()
     def while_hovered(self):
         self.hover = True
     def disable(self):
         self.hover = False
-        cache = ButtonCache.load_button(
-            object_id=self.internal.id, unavailable=True
-        )
-        if cache:
-            sprite = cache['surface']
-        else:
-            sprite = ButtonCache.store_button(
-                Button.new(size=self.relative_rect.size,
-                           text=self.internal.text, unavailable=True,
-                           rounded_corners=self.rounded_corners,
-                           hanging=self.hanging, shadows=self.shadows,
-                           object_id=self.internal.id),
-                object_id=self.internal.id, hover=False, unavailable=True
-            )
-        self.internal.image.set_image(pygame.transform.scale(sprite, self.relative_rect.size))
+        self._set_state("unavailable")
         super().disable()
     def enable(self):
-        cache = ButtonCache.load_button(
-            object_id=self.internal.id, hover=self.hover, unavailable=False
-        )
-        if cache:
-            sprite = cache['surface']
-        else:
-            sprite = ButtonCache.store_button(
-                Button.new(size=self.relative_rect.size,
-                           text=self.internal.text, hover=self.hover,
-                           rounded_corners=self.rounded_corners,
-                           hanging=self.hanging, shadows=self.shadows,
-                           object_id=self.internal.id),
-                object_id=self.internal.id, hover=self.hover, unavailable=False
-            )
-        self.internal.image.set_image(pygame.transform.scale(sprite, self.relative_rect.size))
+        self._set_state("hover" if self.hover else "default")
         super().enable()
     def on_unhovered(self):
         self.hover = False
-        cache = ButtonCache.load_button(
-            object_id=self.internal.id, hover=False, unavailable=False
-        )
-        if cache:
-            sprite = cache['surface']
-        else:
-            sprite = ButtonCache.store_button(
-                Button.new(size=self.relative_rect.size,
-                           text=self.internal.text, hover=False,
-                           rounded_corners=self.rounded_corners,
-                           hanging=self.hanging, shadows=self.shadows,
-                           object_id=self.internal.id),
-                object_id=self.internal.id, hover=False, unavailable=False
-            )
-        self.internal.image.set_image(pygame.transform.scale(sprite, self.relative_rect.size))
+        self._set_state("default")
         super().on_unhovered()
     def rebuild(self):
         for key in ["normal_bg", "hovered_bg", "disabled_bg", "selected_bg", "active_bg", 
@@ -530,13 +685,10 @@ class CatButton(pygame_gui.elements.UIButton):
             self.colours[key] = pygame.Color(0, 0, 0, 0) # yes i know this solution is hacky give me a BREAK
         super().rebuild()
 
-if is_web:
-    _Symbol.populate()
-else:
-    _Symbol.__init__()
-
 class RectButton():
     """TODO: document"""
+    __slots__ = ('size', 'surface', 'hover', 'unavailable', 'hanging', 'symbol',
+                 'palette', '_palette_key', 'rounded_corners', 'shadow', 'text')
     def __init__(self,
                  size: tuple,
                  text: str = "",
@@ -550,57 +702,98 @@ class RectButton():
             self.size = (size[0], size[1] - 6)
         else:
             self.size = (size[0], size[1])
-        self.surface = pygame.Surface(self.size, pygame.SRCALPHA)
-        self.surface = self.surface.convert_alpha()
+        # hanging buttons carry a 6px connector strip above the frame;
+        # allocating the final size up front avoids re-blitting the whole
+        # button onto a bigger surface afterwards
+        self.surface = pygame.Surface((self.size[0], self.size[1] + 6) if hanging else self.size, pygame.SRCALPHA)
         self.hover = hover
         self.unavailable = unavailable
         self.hanging = hanging
         self.symbol = False
         if unavailable:
             self.palette = Palette.unavailable
+            self._palette_key = "unavailable"
         elif hover:
             self.palette = Palette.hover
+            self._palette_key = "hover"
         else:
             self.palette = Palette.palette
+            self._palette_key = "default"
         self.rounded_corners = rounded_corners
         self.shadow = shadows
         self.text = self._build_text(text)
         self._build()
 
+    # corner and edge sprites only depend on a handful of parameters, so
+    # build each variant once and reuse it; cached surfaces are shared
+    # and must never be mutated by callers
+    _corner_cache: Dict[tuple, pygame.Surface] = {}
+    _edge_cache: Dict[tuple, pygame.Surface] = {}
+    _edge_column_cache: Dict[tuple, pygame.Surface] = {}
+    _connector: Optional[pygame.Surface] = None
+
     def _corner(self, shadow_corner1: bool, shadow_corner2: bool, rounded: bool = True):
+        """Returns the cached corner sprite for these parameters, building it on first use"""
+        key = (type(self), self._palette_key, rounded, shadow_corner1, shadow_corner2)
+        surface = RectButton._corner_cache.get(key)
+        if surface is None:
+            surface = self._draw_corner(shadow_corner1, shadow_corner2, rounded)
+            RectButton._corner_cache[key] = surface
+        return surface
+
+    def _corner_oriented(self, shadow_corner1: bool, shadow_corner2: bool, rounded: bool, flip_x: bool, flip_y: bool):
+        """Returns the cached corner sprite already flipped to its destination orientation"""
+        key = (type(self), self._palette_key, rounded, shadow_corner1, shadow_corner2, flip_x, flip_y)
+        surface = RectButton._corner_cache.get(key)
+        if surface is None:
+            surface = self._corner(shadow_corner1, shadow_corner2, rounded)
+            if flip_x or flip_y:
+                surface = pygame.transform.flip(surface, flip_x, flip_y)
+            RectButton._corner_cache[key] = surface
+        return surface
+
+    def _draw_corner(self, shadow_corner1: bool, shadow_corner2: bool, rounded: bool = True):
         """TODO: document"""
         surface = pygame.Surface((10, 8), pygame.SRCALPHA)
-        surface = surface.convert_alpha()
         if rounded:
             # outline
-            pygame.draw.rect(surface, self.palette[1], (6, 2, 4, 2))
-            pygame.draw.rect(surface, self.palette[1], (4, 4, 2, 2))
-            pygame.draw.rect(surface, self.palette[1], (2, 6, 2, 2))
+            surface.fill(self.palette[1], (6, 2, 4, 2))
+            surface.fill(self.palette[1], (4, 4, 2, 2))
+            surface.fill(self.palette[1], (2, 6, 2, 2))
             # inline
-            pygame.draw.rect(surface, self.palette[2], (6, 4, 4, 2))
-            pygame.draw.rect(surface, self.palette[2], (4, 6, 2, 2))
+            surface.fill(self.palette[2], (6, 4, 4, 2))
+            surface.fill(self.palette[2], (4, 6, 2, 2))
             # fill
             if shadow_corner1 and shadow_corner2:
-                pygame.draw.rect(surface, self.palette[4], (6, 6, 4, 2))
+                surface.fill(self.palette[4], (6, 6, 4, 2))
             else:
-                pygame.draw.rect(surface, self.palette[3], (6, 6, 4, 2))
+                surface.fill(self.palette[3], (6, 6, 4, 2))
             return surface
 
         # outline
-        pygame.draw.rect(surface, self.palette[1], (0, 0, 10, 2))
-        pygame.draw.rect(surface, self.palette[1], (0, 0, 2, 8))
+        surface.fill(self.palette[1], (0, 0, 10, 2))
+        surface.fill(self.palette[1], (0, 0, 2, 8))
         # inline
-        pygame.draw.rect(surface, self.palette[2], (2, 2, 8, 2))
-        pygame.draw.rect(surface, self.palette[2], (2, 2, 2, 6))
+        surface.fill(self.palette[2], (2, 2, 8, 2))
+        surface.fill(self.palette[2], (2, 2, 2, 6))
         # fill
-        pygame.draw.rect(surface, self.palette[3], (4, 4, 6, 2))
+        surface.fill(self.palette[3], (4, 4, 6, 2))
         if shadow_corner1:
-            pygame.draw.rect(surface, self.palette[4], (4, 4, 6, 2))
+            surface.fill(self.palette[4], (4, 4, 6, 2))
         if shadow_corner2:
-            pygame.draw.rect(surface, self.palette[4], (4, 4, 2, 4))
+            surface.fill(self.palette[4], (4, 4, 2, 4))
         return surface
 
     def _edge(self, length: int, rotate: bool = False, flip: bool = False, shadow = False):
+        """Returns the cached edge sprite for these parameters, building it on first use"""
+        key = (self._palette_key, length, rotate, flip, shadow)
+        surface = RectButton._edge_cache.get(key)
+        if surface is None:
+            surface = self._draw_edge(length, rotate, flip, shadow)
+            RectButton._edge_cache[key] = surface
+        return surface
+
+    def _draw_edge(self, length: int, rotate: bool = False, flip: bool = False, shadow = False):
         """TODO: document"""
         odd = False
         if round(length / 2) != int(length / 2):
@@ -609,17 +802,23 @@ class RectButton():
                 odd = True
         if length <= 0:
             length = 0
+        # an edge is just a 1px column of color bands stretched sideways;
+        # cache the column per (palette, shadow) and let SDL do the rest
+        key = (self._palette_key, shadow)
+        column = RectButton._edge_column_cache.get(key)
+        if column is None:
+            column = pygame.Surface((1, 6), pygame.SRCALPHA)
+            column.fill(self.palette[1], (0, 0, 1, 2)) # outline
+            column.fill(self.palette[2], (0, 2, 1, 2)) # inline
+            column.fill(self.palette[4] if shadow else self.palette[3], (0, 4, 1, 2)) # fill
+            RectButton._edge_column_cache[key] = column
         surface = pygame.Surface((length, 6), pygame.SRCALPHA)
-        surface = surface.convert_alpha()
-        # outline
-        pygame.draw.rect(surface, self.palette[1], (0, 0, length, 2))
-        # inline
-        pygame.draw.rect(surface, self.palette[2], (0, 2, length if not odd else length-1, 2))
-        # fill
-        if shadow:
-            pygame.draw.rect(surface, self.palette[4], (0, 4, length if not odd else length-1, 2))
-        else:
-            pygame.draw.rect(surface, self.palette[3], (0, 4, length if not odd else length-1, 2))
+        if length:
+            # odd lengths keep their extra column outline-only
+            body = length - 1 if odd else length
+            surface.blit(pygame.transform.scale(column, (body, 6)), (0, 0))
+            if odd:
+                surface.fill(self.palette[1], (body, 0, 1, 2))
 
         if rotate and flip:
             surface = pygame.transform.rotate(surface, 90)
@@ -636,155 +835,175 @@ class RectButton():
         if _Symbol.custom.get(text):
             self.symbol = True
             return _Symbol.custom[text]
-        texts = []
+        lines = []
         height = 0
         width = 0
         for line in text.split("\n"):
-            height_temp = 0 # define temporary width and height, for searching through formatted
-            width_temp = 0
-            formatted = ['']
-            regex = re.split(r"({|})", line)
-            for e,char in enumerate(regex):
-                if char == '':
-                    pass
-                elif char == '{':
-                    formatted.append('')
-                    formatted[-1] += char
-                elif regex[e-1] == '{':
-                    formatted[-1] += char
-                elif char == '}':
-                    formatted[-1] += char
-                    formatted.append('')
-                else:
-                    formatted[-1] += char
-            formatted = list(filter(None, formatted))
-            surfaces = []
+            # split the line into literal text and {SYMBOL} tokens in one
+            # pass over the compiled pattern's matches
+            formatted = []
+            pos = 0
+            for match in _SYM_RE.finditer(line):
+                if match.start() > pos:
+                    formatted.append(line[pos:match.start()])
+                formatted.append(match.group())
+                pos = match.end()
+            if pos < len(line):
+                formatted.append(line[pos:])
+            # lay the chunks out as (surface, x offset) pairs; no per-line
+            # intermediate surface, they blit straight onto the composite
+            chunks = []
+            line_width = 0
+            line_height = 0
             for item in formatted:
                 if _Symbol.custom.get(item):
-                    text = _Symbol.custom[item]
-                    text_ = pygame.Surface((text.get_width(), text.get_height() + 4), pygame.SRCALPHA)
-                    text_ = text_.convert_alpha()
-                    text_.blit(text, (0, 0))
-                    text = text_
-                    del text_
+                    # symbols hang 4px above the text baseline; the padding
+                    # only matters for the height tally, so no wrapper surface
+                    chunk = _Symbol.custom[item]
+                    pad = 4
                 else:
-                    text = FONT.render(item, False, COLOR)
-
-                surfaces.append(text)
-                width_temp += text.get_width()
-                if text.get_height() > height_temp:
-                    height_temp = text.get_height()
-            text_surface = pygame.Surface((width_temp, height_temp), pygame.SRCALPHA)
-            text_surface = text_surface.convert_alpha()
-            current_width = 0
-            for surface in surfaces:
-                text_surface.blit(surface, (current_width, 0))
-                current_width += surface.get_width()
-
-            texts.append(text_surface)
-            height += height_temp
-            if text_surface.get_width() > width:
-                width = text_surface.get_width()
+                    chunk = _render_text(item)
+                    pad = 0
+                chunks.append((chunk, line_width))
+                line_width += chunk.get_width()
+                if chunk.get_height() + pad > line_height:
+                    line_height = chunk.get_height() + pad
+            lines.append((chunks, line_width, line_height))
+            height += line_height
+            if line_width > width:
+                width = line_width
         surface = pygame.Surface((width, height), pygame.SRCALPHA)
-        surface = surface.convert_alpha()
+        blit_list = []
         current_height = 0
-        for text in texts:
-            surface.blit(text, (width / 2 - text.get_width() / 2, current_height))
-            current_height += text.get_height()
+        for chunks, line_width, line_height in lines:
+            line_x = (width - line_width) // 2
+            for chunk, offset in chunks:
+                blit_list.append((chunk, (line_x + offset, current_height)))
+            current_height += line_height
+        surface.fblits(blit_list)
         return surface
 
     def _build(self):
         """TODO: document"""
-        # fill [5]
-        pygame.draw.rect(self.surface, self.palette[3], (4, 4, self.size[0]-8, self.size[1]-8))
-        # corners [1, 3, 7, 9]
-        self.surface.blit(self._corner(self.shadow[0], self.shadow[1], rounded=self.rounded_corners[0]), (0, 0))
-        self.surface.blit(pygame.transform.flip(self._corner(self.shadow[0], self.shadow[2], rounded=self.rounded_corners[1]), True, False), (self.size[0]-10, 0))
-        self.surface.blit(pygame.transform.flip(self._corner(self.shadow[3], self.shadow[1], rounded=self.rounded_corners[2]), False, True), (0, self.size[1] - 8))
-        self.surface.blit(pygame.transform.flip(self._corner(self.shadow[3], self.shadow[2], rounded=self.rounded_corners[3]), True, True), (self.size[0]-10, self.size[1] - 8))
-
-        # edges [2, 4, 6, 8]
-        self.surface.blit(self._edge(self.size[0]-20, shadow=self.shadow[0]), (10, 0))
-        self.surface.blit(self._edge(self.size[1]-16, rotate=True, shadow=self.shadow[1]), (0, 8))
-        self.surface.blit(self._edge(self.size[1]-16, rotate=True, flip=True, shadow=self.shadow[2]), (self.size[0]-6, 8))
-        self.surface.blit(self._edge(self.size[0]-20, flip=True, shadow=self.shadow[3]), (10, self.size[1]-6))
-
-        # text & hang
-        if self.hanging:
+        # bind the hot attributes to locals once; _build touches each of
+        # them several times and LOAD_FAST is far cheaper than the
+        # attribute + subscript dance
+        width, height = self.size
+        shadow = self.shadow
+        rounded = self.rounded_corners
+        text = self.text
+        # hanging buttons live 6px down on their taller surface, with the
+        # connector studs stamped into the strip above the frame
+        y = 6 if self.hanging else 0
+        if y:
             self._hang()
-            text_rect = self.text.get_rect(center=(self.size[0] / 2 + 1, self.size[1] / 2 + 2 + 6))
-        elif self.symbol:
-            text_rect = self.text.get_rect(center=(self.size[0] / 2, self.size[1] / 2))
+        # fill [5] - a plain fill is a single C call
+        self.surface.fill(self.palette[3], (4, 4 + y, width-8, height-8))
+        # corners [1, 3, 7, 9] (pre-flipped into place by the cache) and
+        # edges [2, 4, 6, 8], stamped in one batched C call
+        draw_list = [
+            (self._corner_oriented(shadow[0], shadow[1], rounded[0], False, False), (0, y)),
+            (self._corner_oriented(shadow[0], shadow[2], rounded[1], True, False), (width-10, y)),
+            (self._corner_oriented(shadow[3], shadow[1], rounded[2], False, True), (0, height - 8 + y)),
+            (self._corner_oriented(shadow[3], shadow[2], rounded[3], True, True), (width-10, height - 8 + y)),
+            (self._edge(width-20, shadow=shadow[0]), (10, y)),
+            (self._edge(height-16, rotate=True, shadow=shadow[1]), (0, 8 + y)),
+            (self._edge(height-16, rotate=True, flip=True, shadow=shadow[2]), (width-6, 8 + y)),
+            (self._edge(width-20, flip=True, shadow=shadow[3]), (10, height-6 + y)),
+        ]
+
+        # text; the centered position is plain integer math, no throwaway
+        # Rect needed
+        text_width, text_height = text.get_size()
+        if self.symbol and not y:
+            text_pos = (width // 2 - text_width // 2, height // 2 - text_height // 2)
         else:
-            text_rect = self.text.get_rect(center=(self.size[0] / 2 + 1, self.size[1] / 2 + 2))
+            text_pos = (width // 2 + 1 - text_width // 2, height // 2 + 2 + y - text_height // 2)
+        draw_list.append((text, text_pos))
 
-        if text_rect.width > self.size[0]:
-            # raise ValueError(f'Text width is too large to fit in the button! Minimum width is {text_rect.width}, recommended {text_rect.width + 12}')
+        if text_width > width:
+            # raise ValueError(f'Text width is too large to fit in the button! Minimum width is {text_width}, recommended {text_width + 12}')
             pass
-        if text_rect.width > self.size[0] - 8 and DEBUG:
-            warnings.warn(f'Text width is too small to fit in the button comfortably, minimum width is {text_rect.width + 12}')
+        if text_width > width - 8 and DEBUG:
+            warnings.warn(f'Text width is too small to fit in the button comfortably, minimum width is {text_width + 12}')
         # yell at you if the text will be offset by 1px
-        # if text_rect.width % 2 != 0 and self.size[0] % 2 == 0 and DEBUG:
+        # if text_width % 2 != 0 and width % 2 == 0 and DEBUG:
         #     warnings.warn('Text has an odd width! Consider using an odd width instead of an even one.', Warning, stacklevel=5)
-        # elif text_rect.width % 2 == 0 and self.size[0] % 2 != 0 and DEBUG:
+        # elif text_width % 2 == 0 and width % 2 != 0 and DEBUG:
         #     warnings.warn('Text has an even width! Consider using an even width instead of an odd one.', Warning, stacklevel=5)
-        self.surface.blit(self.text, text_rect)
+        self.surface.fblits(draw_list)
 
     def _hang(self):
-        """TODO: document"""
-        surface = pygame.Surface((self.size[0], self.size[1]+6), pygame.SRCALPHA)
-        surface = surface.convert_alpha()
-        surface.blit(self.surface, (0, 6))
-
-        connector = pygame.Surface((10, 6))
-        pygame.draw.rect(connector, Palette.palette[2], (0, 0, 10, 6))
-        pygame.draw.rect(connector, Palette.palette[4], (2, 0, 6, 6))
-        pygame.draw.rect(connector, Palette.palette[3], (4, 0, 2, 6))
-
-        surface.blit(connector, (12, 0))
-        surface.blit(connector, (self.size[0]-22, 0))
-        self.surface = surface
+        """Stamps the two 10x6 connector studs into the strip above the frame"""
+        connector = RectButton._connector
+        if connector is None:
+            connector = pygame.Surface((10, 6))
+            connector.fill(Palette.palette[2], (0, 0, 10, 6))
+            connector.fill(Palette.palette[4], (2, 0, 6, 6))
+            connector.fill(Palette.palette[3], (4, 0, 2, 6))
+            RectButton._connector = connector
+        self.surface.fblits(((connector, (12, 0)), (connector, (self.size[0]-22, 0))))
 
 class SquareButton(RectButton):
     """TODO: document"""
-    def _corner(self, shadow_corner1: bool, shadow_corner2: bool, rounded: bool = True):
+    __slots__ = ()
+    def _draw_corner(self, shadow_corner1: bool, shadow_corner2: bool, rounded: bool = True):
         """TODO: document"""
         surface = pygame.Surface((10, 8), pygame.SRCALPHA)
-        surface = surface.convert_alpha()
         if rounded:
             # outline
-            pygame.draw.rect(surface, self.palette[1], (4, 0, 6, 2))
-            pygame.draw.rect(surface, self.palette[1], (2, 2, 2, 2))
-            pygame.draw.rect(surface, self.palette[1], (0, 4, 2, 4))
+            surface.fill(self.palette[1], (4, 0, 6, 2))
+            surface.fill(self.palette[1], (2, 2, 2, 2))
+            surface.fill(self.palette[1], (0, 4, 2, 4))
             # fill
-            pygame.draw.rect(surface, self.palette[3], (4, 4, 4, 4))
+            surface.fill(self.palette[3], (4, 4, 4, 4))
             # inline
-            pygame.draw.rect(surface, self.palette[2], (4, 2, 6, 2))
-            pygame.draw.rect(surface, self.palette[2], (2, 4, 4, 2))
-            pygame.draw.rect(surface, self.palette[2], (2, 4, 2, 4))
+            surface.fill(self.palette[2], (4, 2, 6, 2))
+            surface.fill(self.palette[2], (2, 4, 4, 2))
+            surface.fill(self.palette[2], (2, 4, 2, 4))
             # shadow
             if shadow_corner1:
-                pygame.draw.rect(surface, self.palette[4], (6, 4, 4, 2))
-                pygame.draw.rect(surface, self.palette[4], (4, 6, 2, 2))
+                surface.fill(self.palette[4], (6, 4, 4, 2))
+                surface.fill(self.palette[4], (4, 6, 2, 2))
             elif shadow_corner2:
-                pygame.draw.rect(surface, self.palette[4], (4, 6, 2, 2))
-                pygame.draw.rect(surface, self.palette[4], (6, 4, 2, 2))
+                surface.fill(self.palette[4], (4, 6, 2, 2))
+                surface.fill(self.palette[4], (6, 4, 2, 2))
             return surface
 
         # outline
-        pygame.draw.rect(surface, self.palette[1], (0, 0, 10, 2))
-        pygame.draw.rect(surface, self.palette[1], (0, 0, 2, 8))
+        surface.fill(self.palette[1], (0, 0, 10, 2))
+        surface.fill(self.palette[1], (0, 0, 2, 8))
         # inline
-        pygame.draw.rect(surface, self.palette[2], (2, 2, 8, 2))
-        pygame.draw.rect(surface, self.palette[2], (2, 2, 2, 6))
+        surface.fill(self.palette[2], (2, 2, 8, 2))
+        surface.fill(self.palette[2], (2, 2, 2, 6))
         # fill
-        pygame.draw.rect(surface, self.palette[3], (4, 4, 6, 2))
+        surface.fill(self.palette[3], (4, 4, 6, 2))
         if shadow_corner1:
-            pygame.draw.rect(surface, self.palette[4], (4, 4, 6, 2))
+            surface.fill(self.palette[4], (4, 4, 6, 2))
         if shadow_corner2:
-            pygame.draw.rect(surface, self.palette[4], (4, 4, 2, 4))
+            surface.fill(self.palette[4], (4, 4, 2, 4))
         return surface
 
+@functools.lru_cache(maxsize=512)
+def _build_button(size: tuple,
+                  text: str,
+                  hover: bool,
+                  unavailable: bool,
+                  rounded_corners: tuple,
+                  shadows: tuple,
+                  hanging: bool) -> pygame.Surface:
+    """Builds (or returns the memoized) raw button surface for these parameters
+
+    Keyed purely on what the pixels depend on, so buttons that share a
+    look but not an #object_id still share one build. The returned
+    surface is shared - callers must not draw on it.
+    """
+    if size[0] == size[1]:
+        button = SquareButton(size, text, hover, unavailable, rounded_corners, shadows, hanging)
+    else:
+        button = RectButton(size, text, hover, unavailable, rounded_corners, shadows, hanging)
+    return button.surface
+
 class Button():
     custom = [
         "#checked_checkbox", "#unchecked_checkbox"
@@ -795,27 +1014,92 @@ class Button():
             text: str = "",
             hover: bool = False,
             unavailable: bool = False,
-            rounded_corners: Union[bool, list] = [True, True, True, True],
-            shadows: Union[bool, list] = [True, True, False, False],
+            rounded_corners: bool | list = _DEFAULT_ROUND,
+            shadows: bool | list = _DEFAULT_SHADOW,
             hanging: bool = False,
             object_id: str = "") -> pygame.Surface:
         """TODO: document"""
         if object_id in Button.custom:
             return CustomButton.handle(object_id, size, text, hover, unavailable, rounded_corners, shadows, hanging)
-        if isinstance(rounded_corners, bool):
-            rounded_corners = [rounded_corners]*4
-        elif not isinstance(rounded_corners, list) and len(rounded_corners) != 4:
-            raise ValueError("rounded_corners must be of type bool or list[bool; 4]")
-
-        if isinstance(shadows,  bool):
-            shadows = [shadows]*4
-        elif not isinstance(shadows, list) and len(shadows) != 4:
-            raise ValueError("shadows must be of type bool or list[bool; 4]")
-        if size[0] == size[1]:
-            button = SquareButton(size, text, hover, unavailable, rounded_corners, shadows, hanging)
+        # normalize straight to the hashable tuples the cache keys want;
+        # the type() checks keep the default/bool happy paths cheap
+        if type(rounded_corners) is bool:
+            rounded_corners = (rounded_corners,)*4
+        else:
+            rounded_corners = tuple(rounded_corners)
+            if len(rounded_corners) != 4:
+                raise ValueError("rounded_corners must be of type bool or list[bool; 4]")
+
+        if type(shadows) is bool:
+            shadows = (shadows,)*4
         else:
-            button = RectButton(size, text, hover, unavailable, rounded_corners, shadows, hanging)
-        return button.surface
+            shadows = tuple(shadows)
+            if len(shadows) != 4:
+                raise ValueError("shadows must be of type bool or list[bool; 4]")
+        return _build_button(tuple(size), text, hover, unavailable,
+                             rounded_corners, shadows, hanging)
+
+    @staticmethod
+    def new_many(specs: list) -> list:
+        """Builds a batch of button surfaces, sharing one frame per look
+
+        Each spec is a dict of Button.new keyword arguments. Specs that
+        differ only by text reuse a single prebuilt frame: the frame is
+        assembled once per group and each label is blitted onto a copy,
+        so a list rebuild pays one text blit per button instead of a
+        full frame build. Unlike Button.new, the returned surfaces are
+        not shared with any cache and are safe to draw on.
+        """
+        templates = {}
+        surfaces = []
+        for spec in specs:
+            if spec.get("object_id", "") in Button.custom:
+                surfaces.append(Button.new(**spec))
+                continue
+            size = tuple(spec["size"])
+            rounded_corners = spec.get("rounded_corners", _DEFAULT_ROUND)
+            if type(rounded_corners) is bool:
+                rounded_corners = (rounded_corners,)*4
+            else:
+                rounded_corners = tuple(rounded_corners)
+                if len(rounded_corners) != 4:
+                    raise ValueError("rounded_corners must be of type bool or list[bool; 4]")
+            shadows = spec.get("shadows", _DEFAULT_SHADOW)
+            if type(shadows) is bool:
+                shadows = (shadows,)*4
+            else:
+                shadows = tuple(shadows)
+                if len(shadows) != 4:
+                    raise ValueError("shadows must be of type bool or list[bool; 4]")
+            hover = bool(spec.get("hover", False))
+            unavailable = bool(spec.get("unavailable", False))
+            hanging = bool(spec.get("hanging", False))
+            key = (size, hover, unavailable, rounded_corners, shadows, hanging)
+            template = templates.get(key)
+            if template is None:
+                if size[0] == size[1]:
+                    template = SquareButton(size, "", hover, unavailable, rounded_corners, shadows, hanging)
+                else:
+                    template = RectButton(size, "", hover, unavailable, rounded_corners, shadows, hanging)
+                templates[key] = template
+            surface = template.surface.copy()
+            text = spec.get("text", "")
+            if text:
+                # same centering math as RectButton._build, against the
+                # frame size (hanging frames are 6px shorter than the
+                # requested size)
+                template.symbol = False
+                label = template._build_text(text)
+                text_width, text_height = label.get_size()
+                frame_width, frame_height = template.size
+                y = 6 if hanging else 0
+                if template.symbol and not y:
+                    text_pos = (frame_width // 2 - text_width // 2, frame_height // 2 - text_height // 2)
+                else:
+                    text_pos = (frame_width // 2 + 1 - text_width // 2, frame_height // 2 + 2 + y - text_height // 2)
+                surface.blit(label, text_pos)
+            surfaces.append(surface)
+        return surfaces
 
 class CustomButton():
     @staticmethod
@@ -824,8 +1108,8 @@ class CustomButton():
                text: str = "",
                hover: bool = False,
                unavailable: bool = False,
-               rounded_corners: Union[bool, list] = [True, True, True, True],
-               shadows: Union[bool, list] = [True, True, False, False],
+               rounded_corners: bool | list = [True, True, True, True],
+               shadows: bool | list = [True, True, False, False],
                hanging: bool = False) -> pygame.Surface:
         if object_id == "#checked_checkbox":
             return CustomButton.checkbox(checked=True, hover=hover, unavailable=unavailable)
@@ -836,7 +1120,6 @@ class CustomButton():
                  hover: bool = False,
                  unavailable: bool = False) -> pygame.Surface:
         surface = pygame.Surface((34, 34), pygame.SRCALPHA)
-        surface = surface.convert_alpha()
         inner_button = Button.new((22, 22), "", unavailable=unavailable, hover=hover, shadows=[True, False, True, False])
         surface.blit(inner_button, (6, 6))
         if checked:
@@ -851,8 +1134,8 @@ class pyggui_UIImage(pygame_gui.elements.UIImage):
                  image_is_alpha_premultiplied: bool = False,
                  container: Optional[pygame_gui.core.interfaces.IContainerLikeInterface] = None,
                  parent_element: Optional[pygame_gui.core.UIElement] = None,
-                 object_id: Optional[Union[pygame_gui.core.ObjectID, str]] = None,
-                 anchors: Optional[Dict[str, Union[str, pygame_gui.core.UIElement]]] = None,
+                 object_id: pygame_gui.core.ObjectID | str | None = None,
+                 anchors: Dict[str, str | pygame_gui.core.UIElement] | None = None,
                  visible: int = 1,
                  starting_height: int = 1):
 
@@ -1,4 +1,5 @@
 # pylint: disable=no-member
+import asyncio
 import platform
 from sys import platform as _platform
 import os
@@ -21,6 +22,16 @@ class window:
             return
         platform.window[key] = value
 
+async def wait_for(key):
+    """
+    Waits until window[key] is truthy, yielding to the browser event loop
+    between checks instead of sleeping on a fixed timer.
+    """
+    if not is_web:
+        return
+    while not platform.window[key]:
+        await asyncio.sleep(0)
+
 def reload():
     if not is_web:
         return
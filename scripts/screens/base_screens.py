@@ -16,6 +16,9 @@ class Screens():
     game_x = screen_x
     game_y = screen_y
     last_screen = ''
+    # Set this to True on screens whose on_use() repaints the entire screen,
+    # so the main loop can skip its full-screen background fill for them.
+    screen_covers_background = False
 
     # menu buttons are used very often, so they are generated here.
     menu_buttons = {
@@ -107,7 +110,7 @@ class Screens():
 
         game.switches['cur_screen'] = new_screen
         game.switch_screens = True
-        if not web.is_web:
+        if not web.is_web and game.rpc:
             game.rpc.update_rpc.set()
         
 
@@ -205,7 +208,6 @@ class Screens():
         if game.settings["moons and seasons"]:
             self.menu_buttons['stats'].dynamic_dimensions_orig_top_left = scale_dimentions((1388, 190))
             self.menu_buttons['stats']._rect = scale(pygame.Rect(1388, 190, 162, 60))
-            self.menu_buttons['stats'].image.blit_data[1] = scale(pygame.Rect(1388, 190, 162, 60))
             self.menu_buttons['stats'].rebuild()
             self.menu_buttons['moons_n_seasons_arrow'].kill()
             self.menu_buttons['moons_n_seasons'].kill()
@@ -221,7 +223,6 @@ class Screens():
             self.menu_buttons['moons_n_seasons_arrow'].hide()
             self.menu_buttons['stats'].dynamic_dimensions_orig_top_left = scale_dimentions((50, 120))
             self.menu_buttons['stats']._rect = scale(pygame.Rect(50, 120, 162, 60))
-            self.menu_buttons['stats'].image.blit_data[1] = scale(pygame.Rect(50, 120, 162, 60))
             self.menu_buttons['stats'].rebuild()
     
     # open moons and seasons UI (AKA wide version)    
@@ -57,6 +57,8 @@ class StartScreen(Screens):
     """
     TODO: DOCS
     """
+    # on_use blits the full menu background every frame.
+    screen_covers_background = True
 
     def __init__(self, name=None):
         super().__init__(name)
@@ -703,7 +705,7 @@ class SettingsScreen(Screens):
                                                    daemon=True)
                             game.rpc.start()
                             game.rpc.start_rpc.set()
-                        else:
+                        elif game.rpc:
                             print("Stopping Discord RPC")
                             game.rpc.close()
 
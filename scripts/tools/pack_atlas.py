@@ -0,0 +1,59 @@
+"""Build-time tool that packs standalone UI images into a single atlas.
+
+Run from the repository root:
+    python scripts/tools/pack_atlas.py [image_dir]
+
+Packs every .png directly inside image_dir (default resources/images) into
+resources/images/atlas.png plus resources/images/atlas.json, which
+image_cache.load_image picks up at import and serves as subsurface views.
+One decoded sheet then replaces one PNG decode (and, on web, one IDBFS
+round-trip) per image.
+"""
+import json
+import os
+import sys
+
+import pygame
+
+
+def pack(image_dir="resources/images"):
+    pygame.init()
+    paths = sorted(
+        os.path.join(image_dir, name)
+        for name in os.listdir(image_dir)
+        if name.endswith(".png") and name not in ("atlas.png",)
+    )
+    if not paths:
+        print("No images to pack in", image_dir)
+        return
+
+    surfaces = [(path, pygame.image.load(path)) for path in paths]
+    # Shelf packing: tallest first, new row when the shelf width runs out.
+    surfaces.sort(key=lambda item: item[1].get_height(), reverse=True)
+    max_width = max(surf.get_width() for _, surf in surfaces)
+    shelf_width = max(1024, max_width)
+
+    regions = {}
+    x = y = row_height = 0
+    for path, surf in surfaces:
+        w, h = surf.get_size()
+        if x + w > shelf_width:
+            x = 0
+            y += row_height
+            row_height = 0
+        regions[path] = (x, y, w, h)
+        row_height = max(row_height, h)
+        x += w
+
+    atlas = pygame.Surface((shelf_width, y + row_height), pygame.SRCALPHA)
+    for path, surf in surfaces:
+        atlas.blit(surf, regions[path][:2])
+
+    pygame.image.save(atlas, os.path.join("resources/images", "atlas.png"))
+    with open(os.path.join("resources/images", "atlas.json"), "w", encoding="utf-8") as write_file:
+        json.dump(regions, write_file, indent=4)
+    print(f"Packed {len(regions)} images into atlas.png ({atlas.get_width()}x{atlas.get_height()})")
+
+
+if __name__ == "__main__":
+    pack(*sys.argv[1:])
@@ -1270,6 +1270,10 @@ def update_sprite(cat):
         # Don't update the sprite if the cat is faded.
         return
 
+    # Scar and accessory groups load lazily on the first cat-render;
+    # this is a no-op on every call after the first.
+    sprites.load_scars()
+
     # First make pelt, if it wasn't possible before
     if cat.pelt is None:
         init_pelt(cat)
@@ -1524,7 +1528,7 @@ def quit(savesettings=False, clearevents=False):
     if clearevents:
         game.cur_events_list.clear()
     
-    if not web.is_web:
+    if not web.is_web and game.rpc:
         game.rpc.close_rpc.set()
         game.rpc.update_rpc.set()
         if game.rpc.is_alive():